@@ -9,18 +9,23 @@
 """
 
 import asyncio
+import os
 import signal
 import sys
 import time
 import logging
 import json
-import datetime
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Optional
+
+import aiohttp
 
 from config.settings import BotConfig, MarketDirection
-from oracles.price_feed import OracleEngine
-from strategies.signal_engine import StrategyEngine
-from core.polymarket_client import PolymarketClient
+from oracles.price_feed import OracleEngine, ConsensusPrice
+from strategies.signal_engine import StrategyEngine, StrategyDecision
+from core.polymarket_client import PolymarketClient, BinaryMarket
 from core.risk_manager import RiskManager
 from core.trade_logger import TradeLogger
 from core.edge import EdgeEngine
@@ -33,6 +38,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger("bot")
 
+WINDOW_SECS = 15 * 60
+
+
+class _LazyStr:
+    """Log argument that is only stringified if a handler emits the record."""
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn):
+        self._fn = fn
+
+    def __str__(self) -> str:
+        return self._fn()
+
+
+@dataclass(slots=True)
+class CycleContext:
+    """Per-cycle state handed to each order stage."""
+    consensus: ConsensusPrice
+    decision: StrategyDecision
+    direction: str
+    tradeable: list[BinaryMarket]
+    by_cid: dict[str, BinaryMarket]
+    market: BinaryMarket
+    orders: list = field(default_factory=list)  # (kind, context, deferred place_order)
+
 
 class BTCPredictionBot:
     def __init__(self, config: BotConfig, dashboard: bool = False):
@@ -47,33 +77,56 @@ class BTCPredictionBot:
         self.dashboard = DashboardServer() if dashboard else None
         self._cycle_count = 0
         self._start_time = 0
-        self._traded_this_window = False
+        self._last_entry_boundary = 0.0
+        self._wakeup = asyncio.Event()
         self._last_consensus = None
         self._last_anchor = None
         self._last_decision = None
+        self._connector: Optional[aiohttp.TCPConnector] = None  # created in run()
+        self._pipeline = self._build_pipeline()
 
     # ── Trading Cycle ───────────────────────────────────────────
 
     async def _trading_cycle(self):
         self._cycle_count += 1
+        pm, rm, tl, edge = self.polymarket, self.risk_manager, self.trade_logger, self.edge
 
         try:
-            # 1. Capture window opening price (Chainlink — resolution oracle)
-            anchor = await self.oracle.capture_window_open()
+            # 1-3. Anchor, price, candles and markets are independent network
+            # fetches — issue them together so the entry pays one round trip.
+            anchor, consensus, candles, markets = await asyncio.gather(
+                self.oracle.capture_window_open(),
+                self.oracle.get_price(),
+                self.oracle.get_candles("15m", limit=100),
+                pm.discover_markets(),
+                return_exceptions=True,
+            )
+
+            # Consensus price is mandatory — without it there is nothing to trade on
+            if isinstance(consensus, BaseException):
+                raise consensus
+            self._last_consensus = consensus
+
+            # Window opening price (Chainlink — resolution oracle)
+            if isinstance(anchor, BaseException):
+                logger.warning(f"Window anchor unavailable: {anchor}")
+                anchor = None
             open_price = anchor.open_price if anchor else None
             self._last_anchor = anchor
 
-            # 2. Get current price
-            consensus = await self.oracle.get_price()
-            self._last_consensus = consensus
-            self.trade_logger.log_oracle({
+            tl.log_oracle({
                 "price": consensus.price, "chainlink": consensus.chainlink_price,
                 "sources": consensus.sources, "spread_pct": consensus.spread_pct,
                 "window_open": open_price,
             })
 
-            # 3. Candles
-            candles = await self.oracle.get_candles("15m", limit=100)
+            if isinstance(candles, BaseException):
+                logger.error(f"Candles: {candles}")
+                candles = []
+            if isinstance(markets, BaseException):
+                logger.error(f"Discovery failed: {markets}")
+                markets = []
+
             if len(candles) < 30:
                 logger.warning(f"Only {len(candles)} candles — skipping")
                 return
@@ -81,13 +134,17 @@ class BTCPredictionBot:
             # 4. Strategy (anchored to window open price)
             decision = self.strategy.analyze(candles, consensus.price, open_price=open_price)
             self._last_decision = decision
-            self.trade_logger.log_strategy({
-                "direction": decision.direction.value,
+            # Directional side computed once so hedge + execution use the
+            # exact same signal output for this cycle.
+            direction = decision.direction.value
+            tl.log_strategy({
+                "direction": direction,
                 "confidence": decision.confidence,
                 "should_trade": decision.should_trade,
                 "drift_pct": decision.drift_pct,
                 "open_price": open_price,
-                "signals": {s.name: {"dir": s.direction.value, "str": round(s.strength, 3)} for s in decision.signals},
+                # [name, direction, strength] rows — no per-signal dict to build or encode
+                "signals": [(s.name, s.direction.value, round(s.strength, 3)) for s in decision.signals],
                 "btc_price": consensus.price,
             })
 
@@ -96,110 +153,86 @@ class BTCPredictionBot:
                 return
 
             # 5. Risk
-            can_trade, reason = self.risk_manager.can_trade()
+            can_trade, reason = rm.can_trade()
             if not can_trade:
                 logger.info(f"Cycle {self._cycle_count}: BLOCKED — {reason}")
                 return
 
-            # 6. Markets
-            markets = await self.polymarket.discover_markets()
-            tradeable = [m for m in markets if m.is_tradeable and m.liquidity >= self.config.polymarket.min_liquidity_usd]
+            # 6. Markets (fetched above) — one pass filters, indexes by
+            # condition id and picks the most liquid market
+            min_liquidity = self.config.polymarket.min_liquidity_usd
+            tradeable, by_cid, market = [], {}, None
+            for m in markets:
+                if m.is_tradeable and m.liquidity >= min_liquidity:
+                    tradeable.append(m)
+                    by_cid[m.condition_id] = m
+                    if market is None or m.liquidity > market.liquidity:
+                        market = m
 
             if not tradeable:
                 logger.info(f"Cycle {self._cycle_count}: No tradeable markets")
                 return
 
-            market = max(tradeable, key=lambda m: m.liquidity)
-
-            # 6a. Arbitrage scan (if enabled)
-            arb_opps = self.edge.scan_arb(tradeable)
-            for opp in arb_opps:
-                arb_market = next((m for m in tradeable if m.condition_id == opp.market_condition_id), None)
-                if arb_market:
-                    # Buy UP side
-                    await self.polymarket.place_order(
-                        market=arb_market, direction="up", size_usd=opp.size_per_side,
-                        oracle_price=consensus.price, confidence=1.0,
-                    )
-                    # Buy DOWN side
-                    await self.polymarket.place_order(
-                        market=arb_market, direction="down", size_usd=opp.size_per_side,
-                        oracle_price=consensus.price, confidence=1.0,
-                    )
-                    self.trade_logger.log_trade({
-                        "type": "arb", "edge_pct": opp.edge_pct,
-                        "size_per_side": opp.size_per_side, "profit": opp.guaranteed_profit,
-                        "market": opp.question[:80],
-                    })
-
-            # Compute directional side once so hedge + execution use the
-            # exact same signal output for this cycle.
-            direction = decision.direction.value
-
-            # 6b. Hedge check (if enabled)
-            open_trades = self.polymarket.get_trade_records()
-            hedges = self.edge.check_hedge(
-                open_trades=open_trades,
-                current_direction=direction,
-                current_confidence=decision.confidence,
-                markets=self.polymarket._active_markets,
-            )
-            for h in hedges:
-                hedge_market = next(
-                    (m for m in tradeable if m.condition_id ==
-                     next((t.market_condition_id for t in open_trades if t.trade_id == h.original_trade_id), "")),
-                    None
-                )
-                if hedge_market:
-                    trade = await self.polymarket.place_order(
-                        market=hedge_market, direction=h.hedge_direction,
-                        size_usd=h.size_usd, oracle_price=consensus.price,
-                        confidence=decision.confidence,
-                    )
-                    if trade:
-                        self.edge.mark_hedged(h.original_trade_id)
-                        self.trade_logger.log_trade({
-                            "type": "hedge", "original": h.original_trade_id,
-                            "hedge_dir": h.hedge_direction, "locked_profit": h.locked_profit,
-                        })
-
-            # 7. Execute directional trade
-            size = self.risk_manager.calculate_position_size(decision.confidence)
-            if size <= 0:
-                return
-
-            trade = await self.polymarket.place_order(
-                market=market, direction=direction, size_usd=size,
-                oracle_price=consensus.price, confidence=decision.confidence,
+            # 6a-7. Order stages — only those enabled by config run
+            ctx = CycleContext(
+                consensus=consensus, decision=decision, direction=direction,
+                tradeable=tradeable, by_cid=by_cid, market=market,
             )
-
-            if trade:
-                self.trade_logger.log_trade({
-                    "trade_id": trade.trade_id, "direction": trade.direction,
-                    "size_usd": trade.size_usd, "confidence": trade.confidence,
-                    "oracle_price": trade.oracle_price_at_entry,
-                    "order_id": trade.order_id,
-                    "market": market.question[:80],
-                })
+            try:
+                for stage in self._pipeline:
+                    stage(ctx)
+            except Exception as e:
+                # Later stages are skipped, but orders already queued still go out
+                logger.error(f"Cycle {self._cycle_count} order stage failed: {e}", exc_info=True)
+
+            # Every order this cycle (arb legs, hedges, directional) is
+            # independent, so they are sent as one batch.
+            orders = ctx.orders
+            results = await asyncio.gather(*(send() for _, _, send in orders), return_exceptions=True)
+            for (kind, item, _), trade in zip(orders, results):
+                if isinstance(trade, BaseException):
+                    logger.error(f"{kind or 'arb'} order failed: {trade}")
+                    trade = None
+                if kind == "arb":
+                    tl.log_trade({
+                        "type": "arb", "edge_pct": item.edge_pct,
+                        "size_per_side": item.size_per_side, "profit": item.guaranteed_profit,
+                        "market": item.question[:80],
+                    })
+                elif kind == "hedge" and trade:
+                    edge.mark_hedged(item.original_trade_id)
+                    tl.log_trade({
+                        "type": "hedge", "original": item.original_trade_id,
+                        "hedge_dir": item.hedge_direction, "locked_profit": item.locked_profit,
+                    })
+                elif kind == "directional" and trade:
+                    tl.log_trade({
+                        "trade_id": trade.trade_id, "direction": trade.direction,
+                        "size_usd": trade.size_usd, "confidence": trade.confidence,
+                        "oracle_price": trade.oracle_price_at_entry,
+                        "order_id": trade.order_id,
+                        "market": item.question[:80],
+                    })
 
             # 8. Resolutions
-            resolved = await self.polymarket.check_resolutions()
+            resolved = await pm.check_resolutions()
             for r in resolved:
-                self.risk_manager.record_trade(r.pnl)
-                self.trade_logger.log_resolution({"trade_id": r.trade_id, "outcome": r.outcome, "pnl": r.pnl})
+                rm.record_trade(r.pnl)
+                tl.log_resolution({"trade_id": r.trade_id, "outcome": r.outcome, "pnl": r.pnl})
 
             # 8. Status
-            stats = self.polymarket.get_stats()
-            self.trade_logger.save_performance({
+            stats = pm.get_stats()
+            tl.save_performance({
                 "cycle": self._cycle_count, "btc_price": consensus.price,
-                **stats, **self.risk_manager.get_status(),
+                **stats, **rm.get_status(),
             })
 
-            logger.info(
-                f"Cycle {self._cycle_count} | BTC=${consensus.price:,.2f} | "
-                f"{direction.upper()} conf={decision.confidence:.2f} | "
-                f"W/R={stats.get('win_rate', 0):.0f}%"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Cycle {self._cycle_count} | BTC=${consensus.price:,.2f} | "
+                    f"{direction.upper()} conf={decision.confidence:.2f} | "
+                    f"W/R={stats.get('win_rate', 0):.0f}%"
+                )
 
         except Exception as e:
             logger.error(f"Cycle {self._cycle_count} error: {e}", exc_info=True)
@@ -218,45 +251,118 @@ class BTCPredictionBot:
                         edge_config=self.config.edge,
                         config=self.config,
                     )
-                    await self.dashboard.broadcast(state)
+                    # Non-blocking hand-off — the server's broadcaster task does the sends
+                    self.dashboard.publish(state)
                 except Exception as e:
                     logger.warning(f"Dashboard broadcast failed: {e}")
 
+    # ── Order Stages ────────────────────────────────────────────
+    # Each stage queues (kind, context, deferred place_order call) onto
+    # ctx.orders; the cycle creates and awaits them all together, so a
+    # failing stage never leaves an un-awaited coroutine behind.
+
+    def _build_pipeline(self) -> list:
+        """Order stages for this run — disabled features are never called."""
+        stages = []
+        if self.config.edge.enable_arb:
+            stages.append(self._stage_arb)
+        if self.config.edge.enable_hedge:
+            stages.append(self._stage_hedge)
+        stages.append(self._stage_directional)
+        return stages
+
+    def _stage_arb(self, ctx: CycleContext):
+        for opp in self.edge.scan_arb(ctx.tradeable):
+            arb_market = ctx.by_cid.get(opp.market_condition_id)
+            if arb_market:
+                # Buy UP + DOWN sides; the pair is logged once via the UP leg
+                for side, kind in (("up", "arb"), ("down", None)):
+                    ctx.orders.append((kind, opp, partial(self.polymarket.place_order,
+                        market=arb_market, direction=side, size_usd=opp.size_per_side,
+                        oracle_price=ctx.consensus.price, confidence=1.0,
+                    )))
+
+    def _stage_hedge(self, ctx: CycleContext):
+        open_trades = self.polymarket.get_trade_records()
+        hedges = self.edge.check_hedge(
+            open_trades=open_trades,
+            current_direction=ctx.direction,
+            current_confidence=ctx.decision.confidence,
+            markets=self.polymarket.active_markets,
+        )
+        if not hedges:
+            return
+        trade_cid = {t.trade_id: t.market_condition_id for t in open_trades}
+        for h in hedges:
+            hedge_market = ctx.by_cid.get(trade_cid.get(h.original_trade_id, ""))
+            if hedge_market:
+                ctx.orders.append(("hedge", h, partial(self.polymarket.place_order,
+                    market=hedge_market, direction=h.hedge_direction,
+                    size_usd=h.size_usd, oracle_price=ctx.consensus.price,
+                    confidence=ctx.decision.confidence,
+                )))
+
+    def _stage_directional(self, ctx: CycleContext):
+        size = self.risk_manager.calculate_position_size(ctx.decision.confidence)
+        if size > 0:
+            ctx.orders.append(("directional", ctx.market, partial(self.polymarket.place_order,
+                market=ctx.market, direction=ctx.direction, size_usd=size,
+                oracle_price=ctx.consensus.price, confidence=ctx.decision.confidence,
+            )))
+
     # ── Clock Sync ──────────────────────────────────────────────
 
     @staticmethod
     def _next_boundary() -> float:
-        now = time.time()
-        dt = datetime.datetime.fromtimestamp(now)
-        next_min = ((dt.minute // 15) + 1) * 15
-        if next_min >= 60:
-            b = dt.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
-        else:
-            b = dt.replace(minute=next_min, second=0, microsecond=0)
-        return b.timestamp()
-
-    def _seconds_until_entry(self) -> float:
-        return self._next_boundary() - self.config.entry_lead_secs - time.time()
-
-    def _is_in_entry_window(self) -> bool:
-        secs = self._seconds_until_entry()
-        return -self.config.entry_window_secs <= secs <= 0
+        # 15-min boundaries are aligned to the epoch in every real timezone
+        return float((int(time.time()) // WINDOW_SECS + 1) * WINDOW_SECS)
+
+    def _next_entry_boundary(self) -> float:
+        """Boundary the next entry targets — skips a window already traded or missed."""
+        boundary = self._next_boundary()
+        late = time.time() - (boundary - self.config.entry_lead_secs)
+        if boundary <= self._last_entry_boundary or late > self.config.entry_window_secs:
+            boundary += WINDOW_SECS
+        return boundary
+
+    async def _sleep_until_next_entry(self) -> Optional[float]:
+        """
+        Sleep straight to the next entry instant (one timer, no polling)
+        and return the boundary being targeted. Returns None if the bot
+        was stopped while waiting.
+        """
+        while self.running:
+            boundary = self._next_entry_boundary()
+            entry_ts = boundary - self.config.entry_lead_secs
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, entry_ts - time.time()))
+            except asyncio.TimeoutError:
+                pass
+            if not self.running:
+                break
+            # Verify we actually woke inside the window (timer slop, clock jumps)
+            secs = entry_ts - time.time()
+            if -self.config.entry_window_secs <= secs <= 0:
+                self._last_entry_boundary = boundary
+                return boundary
+        return None
 
     def _format_next_entry(self) -> str:
-        entry_ts = self._next_boundary() - self.config.entry_lead_secs
-        entry_dt = datetime.datetime.fromtimestamp(entry_ts)
-        boundary_dt = datetime.datetime.fromtimestamp(self._next_boundary())
-        return f"{entry_dt.strftime('%H:%M:%S')} (→ {boundary_dt.strftime('%H:%M')})"
+        boundary = self._next_entry_boundary()
+        entry_ts = boundary - self.config.entry_lead_secs
+        return f"{time.strftime('%H:%M:%S', time.localtime(entry_ts))} (→ {time.strftime('%H:%M', time.localtime(boundary))})"
 
     # ── Main Loop ───────────────────────────────────────────────
 
-    async def run(self):
+    async def run(self, max_cycles: int = 0):
         print()
         print("=" * 60)
         print("  BTC-15M-Oracle — LIVE")
         print(f"  Bankroll: ${self.config.bankroll:,.2f}")
         print(f"  Arb: {'ON' if self.config.edge.enable_arb else 'off'}  |  Hedge: {'ON' if self.config.edge.enable_hedge else 'off'}")
         print(f"  Entry: {self.config.entry_lead_secs}s before :00/:15/:30/:45")
+        if max_cycles > 0:
+            print(f"  Cycles: {max_cycles}")
         print(f"  Next: {self._format_next_entry()}")
         if self.dashboard:
             print(f"  Dashboard: ws://localhost:8765")
@@ -267,30 +373,96 @@ class BTCPredictionBot:
         if self.dashboard:
             await self.dashboard.start()
 
+        self._apply_cpu_pinning()
+        self._init_connector()
         self.running = True
         self._start_time = time.time()
+        await self._warmup()
+        completed = 0
 
         while self.running:
-            if self._is_in_entry_window():
-                if not self._traded_this_window:
-                    boundary = datetime.datetime.fromtimestamp(self._next_boundary())
-                    logger.info(f"⏰ ENTRY — targeting {boundary.strftime('%H:%M')}")
-                    await self._trading_cycle()
-                    self._traded_this_window = True
-                    logger.info(f"💤 Next: {self._format_next_entry()}")
+            boundary = await self._sleep_until_next_entry()
+            if boundary is None:
+                break
+            logger.info(f"⏰ ENTRY — targeting {time.strftime('%H:%M', time.localtime(boundary))}")
+            await self._trading_cycle()
+            completed += 1
+            if max_cycles > 0:
+                if completed >= max_cycles:
+                    break
+                logger.info("Cycle %d/%d. Next: %s", completed, max_cycles, _LazyStr(self._format_next_entry))
             else:
-                self._traded_this_window = False
-
-            await asyncio.sleep(self.config.sleep_poll_secs)
+                logger.info("💤 Next: %s", _LazyStr(self._format_next_entry))
+
+    def _apply_cpu_pinning(self):
+        """
+        Pin the process to config.pin_cpu and request SCHED_FIFO so entry
+        wakeups aren't delayed by CFS scheduling. Linux only, and meant for a
+        core isolated on the kernel cmdline (e.g. isolcpus=3 nohz_full=3).
+        Without CAP_SYS_NICE falls back to SCHED_OTHER with nice(-10), then
+        to the default priority.
+        """
+        cpu = self.config.pin_cpu
+        if cpu < 0:
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU pinning not supported on this platform")
+            return
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError as e:
+            logger.warning(f"Pin to CPU {cpu} failed: {e}")
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+        except OSError as e:
+            logger.warning(f"SCHED_FIFO unavailable ({e}) — trying nice(-10)")
+            try:
+                os.nice(-10)
+            except OSError as e:
+                logger.warning(f"Raise priority failed ({e}) — default scheduling")
+        try:
+            policy = "SCHED_FIFO" if os.sched_getscheduler(0) == os.SCHED_FIFO else "SCHED_OTHER"
+            logger.info(f"Scheduling: cpus={sorted(os.sched_getaffinity(0))} policy={policy} nice={os.nice(0)}")
+        except OSError as e:
+            logger.warning(f"Scheduling state unavailable: {e}")
+
+    async def _warmup(self):
+        """
+        Exercise every network path once while waiting for the first entry:
+        opens pooled connections, fills the DNS and candle caches and starts
+        the oracle price streams, so the first real entry runs warm.
+        """
+        t0 = time.time()
+        # discover_markets() directly — warm-up prices must not land in the market cache
+        await asyncio.gather(
+            self.oracle.get_price(),
+            self.oracle.get_candles("15m", limit=100),
+            self.polymarket.discover_markets(),
+            return_exceptions=True,
+        )
+        logger.info(f"Warm-up done in {(time.time() - t0) * 1000:.0f}ms")
 
     def stop(self):
         self.running = False
+        self._wakeup.set()
         logger.info("Shutdown initiated")
 
+    def _init_connector(self):
+        """One keep-alive pool + DNS cache shared by the oracle and Polymarket
+        clients, so every cycle reuses warm connections instead of paying a
+        fresh DNS lookup + TLS handshake per host. Built here rather than in
+        __init__ because a connector needs a running event loop."""
+        if self._connector is None:
+            self._connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=1800)
+            self.oracle.use_connector(self._connector)
+            self.polymarket.use_connector(self._connector)
+
     async def shutdown(self):
         self.stop()
         await self.oracle.close()
         await self.polymarket.close()
+        if self._connector is not None:
+            await self._connector.close()
         if self.dashboard:
             await self.dashboard.stop()
         stats = self.polymarket.get_stats()
@@ -298,6 +470,7 @@ class BTCPredictionBot:
             "status": "shutdown", "cycles": self._cycle_count,
             "uptime_secs": time.time() - self._start_time, **stats,
         })
+        await self.trade_logger.close()
         logger.info(f"Stopped after {self._cycle_count} cycles")
 
 
@@ -309,41 +482,34 @@ async def main():
     parser.add_argument("--arb", action="store_true", help="Enable arbitrage scanner")
     parser.add_argument("--hedge", action="store_true", help="Enable hedge engine")
     parser.add_argument("--dashboard", action="store_true", help="Start WebSocket server on :8765 for live dashboard")
+    parser.add_argument("--cpu", type=int, default=-1, help="Pin to this CPU core with SCHED_FIFO (Linux; isolate it with isolcpus=N nohz_full=N)")
     args = parser.parse_args()
 
     config = BotConfig(bankroll=args.bankroll)
     config.edge.enable_arb = args.arb
     config.edge.enable_hedge = args.hedge
+    config.pin_cpu = args.cpu
     bot = BTCPredictionBot(config, dashboard=args.dashboard)
 
-    def handle_signal(sig, frame):
+    def handle_signal(*_):
         print("\n\nCtrl+C — shutting down...")
         bot.stop()
-    signal.signal(signal.SIGINT, handle_signal)
+    try:
+        # Loop-level handler so Ctrl+C wakes the entry timer immediately
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, handle_signal)
+    except NotImplementedError:  # Windows
+        signal.signal(signal.SIGINT, handle_signal)
 
     try:
-        if args.cycles > 0:
-            bot._start_time = time.time()
-            bot.running = True
-            completed = 0
-            print(f"\nRunning {args.cycles} cycles | Bankroll: ${args.bankroll}")
-            print(f"Next: {bot._format_next_entry()}\n")
-            while completed < args.cycles and bot.running:
-                if bot._is_in_entry_window():
-                    if not bot._traded_this_window:
-                        await bot._trading_cycle()
-                        bot._traded_this_window = True
-                        completed += 1
-                        if completed < args.cycles:
-                            logger.info(f"Cycle {completed}/{args.cycles}. Next: {bot._format_next_entry()}")
-                else:
-                    bot._traded_this_window = False
-                await asyncio.sleep(bot.config.sleep_poll_secs)
-        else:
-            await bot.run()
+        await bot.run(max_cycles=args.cycles)
     finally:
         await bot.shutdown()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # libuv event loop — faster awaits and socket I/O
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -23,6 +23,7 @@ class OracleConfig:
     coincap_base_url: str = "https://api.coincap.io/v2"
     poll_interval: int = 10
     max_price_age: int = 30
+    stream_max_age: int = 10      # streamed price older than this → REST/one-shot fallback
     min_oracle_consensus: int = 2
     history_candle_count: int = 100
     candle_interval: str = "15m"
@@ -97,7 +98,7 @@ class LoggingConfig:
     strategy_log_file: str = "logs/strategy.jsonl"
     oracle_log_file: str = "logs/oracle.jsonl"
     error_log_file: str = "logs/errors.log"
-    performance_file: str = "data/performance.json"
+    performance_file: str = "data/performance.jsonl"
     alert_on_loss_streak: int = 3
     alert_on_oracle_downtime_secs: int = 60
 
@@ -117,4 +118,5 @@ class BotConfig:
     # Clock-sync timing
     entry_lead_secs: int = 60
     entry_window_secs: int = 30
-    sleep_poll_secs: int = 5
+    # Scheduling — set via CLI: python bot.py --cpu 3 (-1 = don't pin)
+    pin_cpu: int = -1
@@ -17,7 +17,7 @@ from typing import Optional
 logger = logging.getLogger("edge")
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbOpportunity:
     """A detected arbitrage: buy both sides for guaranteed profit."""
     market_condition_id: str
@@ -30,7 +30,7 @@ class ArbOpportunity:
     guaranteed_profit: float # expected profit
 
 
-@dataclass
+@dataclass(slots=True)
 class HedgeAction:
     """A hedge: buy the opposite side to lock in a spread."""
     original_trade_id: str
@@ -77,36 +77,40 @@ class EdgeEngine:
         if not self.arb_enabled:
             return []
 
+        threshold = self.arb_threshold
+        min_edge_pct = self.arb_min_edge_pct
+        size = self.arb_size_usd
+
         opportunities = []
         for m in markets:
-            if not m.is_tradeable:
+            combined = m.price_up + m.price_down
+
+            # Cheap numeric reject first — nearly every market exits here
+            if combined >= threshold or not m.is_tradeable:
                 continue
 
-            combined = m.price_up + m.price_down
+            edge_pct = (1.0 - combined) * 100
+            if edge_pct < min_edge_pct:
+                continue
 
-            if combined < self.arb_threshold:
-                edge_pct = (1.0 - combined) * 100
-                if edge_pct < self.arb_min_edge_pct:
-                    continue
-
-                profit = self.arb_size_usd * (1.0 / combined - 1.0)
-
-                opp = ArbOpportunity(
-                    market_condition_id=m.condition_id,
-                    question=m.question,
-                    price_up=m.price_up,
-                    price_down=m.price_down,
-                    combined=combined,
-                    edge_pct=edge_pct,
-                    size_per_side=self.arb_size_usd,
-                    guaranteed_profit=round(profit, 2),
-                )
-                opportunities.append(opp)
-                logger.info(
-                    f"💰 ARB: {m.question[:50]}... | "
-                    f"UP={m.price_up:.3f} + DOWN={m.price_down:.3f} = {combined:.3f} | "
-                    f"edge={edge_pct:.1f}% | profit=${profit:.2f}"
-                )
+            profit = size * (1.0 / combined - 1.0)
+
+            opp = ArbOpportunity(
+                market_condition_id=m.condition_id,
+                question=m.question,
+                price_up=m.price_up,
+                price_down=m.price_down,
+                combined=combined,
+                edge_pct=edge_pct,
+                size_per_side=size,
+                guaranteed_profit=round(profit, 2),
+            )
+            opportunities.append(opp)
+            logger.info(
+                f"💰 ARB: {m.question[:50]}... | "
+                f"UP={m.price_up:.3f} + DOWN={m.price_down:.3f} = {combined:.3f} | "
+                f"edge={edge_pct:.1f}% | profit=${profit:.2f}"
+            )
 
         return opportunities
 
@@ -6,13 +6,16 @@
 ╚══════════════════════════════════════════════════════════════════╝
 """
 
+import asyncio
+import itertools
 import time
 import logging
 import json
 import os
 import re
+import types
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Mapping, Optional
 from enum import Enum
 
 import aiohttp
@@ -78,17 +81,25 @@ class TradeRecord:
     order_id: Optional[str] = None
     tx_hashes: list = field(default_factory=list)
 
+    @property
+    def is_resolved(self) -> bool:
+        return self.outcome is not None
+
 
 class PolymarketClient:
     """Live Polymarket CLOB client using py-clob-client SDK."""
 
-    def __init__(self, config):
+    def __init__(self, config, connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config.polymarket
+        self._connector = connector  # shared pool, owned by the caller
         self._session: Optional[aiohttp.ClientSession] = None
         self._clob: Optional[object] = None
         self._clob_initialized = False
         self._active_markets: dict[str, BinaryMarket] = {}
+        self._markets_view = types.MappingProxyType(self._active_markets)
         self._trade_records: list[TradeRecord] = []
+        self.trade_revision = 0  # bumped whenever a record is added or resolved
+        self._order_seq = itertools.count(1)
 
     # ── CLOB Init ───────────────────────────────────────────────
 
@@ -120,9 +131,16 @@ class PolymarketClient:
 
     # ── HTTP ────────────────────────────────────────────────────
 
+    def use_connector(self, connector: aiohttp.BaseConnector):
+        """Share a caller-owned pool — used by sessions opened after this call."""
+        self._connector = connector
+
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15), headers={"Content-Type": "application/json"})
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15), headers={"Content-Type": "application/json"},
+                connector=self._connector, connector_owner=self._connector is None,
+            )
         return self._session
 
     async def close(self):
@@ -239,6 +257,14 @@ class PolymarketClient:
 
     # ── Order Execution ─────────────────────────────────────────
 
+    def _sign_and_post(self, args, order_type) -> dict:
+        """Blocking SDK path (EIP-712 sign + POST) — run in a worker thread."""
+        if isinstance(args, MarketOrderArgs):
+            signed = self._clob.create_market_order(args)
+        else:
+            signed = self._clob.create_order(args)
+        return self._clob.post_order(signed, order_type)
+
     async def place_order(self, market: BinaryMarket, direction: str, size_usd: float,
                           price: Optional[float] = None, oracle_price: float = 0.0,
                           confidence: float = 0.0) -> Optional[TradeRecord]:
@@ -250,13 +276,14 @@ class PolymarketClient:
             logger.warning(f"Size ${size_usd:.2f} too small")
             return None
 
-        trade_id = f"T-{int(time.time() * 1000)}-{direction[0].upper()}"
+        # Sequence suffix keeps ids unique when a batch fires in the same millisecond
+        trade_id = f"T-{int(time.time() * 1000)}-{next(self._order_seq)}-{direction[0].upper()}"
 
         if not self._clob_initialized:
             self._init_clob_client()
 
         try:
-            clob_price = self.get_clob_price(token_id, side="BUY")
+            clob_price = await asyncio.to_thread(self.get_clob_price, token_id, "BUY")
             exec_price = clob_price if clob_price else price
             logger.info(f"Price: {exec_price:.4f} (clob={clob_price}, gamma={price:.4f})")
 
@@ -273,13 +300,11 @@ class PolymarketClient:
             if mode == "market":
                 logger.info(f"🔴 MARKET ORDER: {direction.upper()} ${size_usd:.2f} ({shares:.1f} shares)")
                 args = MarketOrderArgs(token_id=token_id, amount=size_usd, side=BUY, order_type=OrderType.FOK)
-                signed = self._clob.create_market_order(args)
-                resp = self._clob.post_order(signed, OrderType.FOK)
+                resp = await asyncio.to_thread(self._sign_and_post, args, OrderType.FOK)
             else:
                 logger.info(f"🔴 LIMIT ORDER: {direction.upper()} {shares:.1f} @ {exec_price:.4f}")
                 args = OrderArgs(price=exec_price, size=shares, side=BUY, token_id=token_id)
-                signed = self._clob.create_order(args)
-                resp = self._clob.post_order(signed, OrderType.GTC)
+                resp = await asyncio.to_thread(self._sign_and_post, args, OrderType.GTC)
 
             logger.info(f"Response: {json.dumps(resp, indent=2)}")
 
@@ -303,6 +328,7 @@ class PolymarketClient:
                 order_id=order_id, tx_hashes=tx_hashes,
             )
             self._trade_records.append(record)
+            self.trade_revision += 1
             logger.info(f"✅ {trade_id} | {direction.upper()} | ${size_usd:.2f} @ {fill_price:.4f} | {status}")
             return record
 
@@ -325,16 +351,24 @@ class PolymarketClient:
     # ── Resolution ──────────────────────────────────────────────
 
     async def check_resolutions(self) -> list[TradeRecord]:
-        resolved = []
-        for r in self._trade_records:
-            if r.outcome is not None:
-                continue
-            if r.market_condition_id in self._active_markets:
-                try:
-                    await self._refresh_market_resolution(r.market_condition_id)
-                except Exception as e:
-                    logger.warning(f"Resolution refresh failed for {r.market_condition_id}: {e}")
+        pending = [r for r in self._trade_records if r.outcome is None]
+
+        # One Gamma refresh per unresolved market, all in flight together
+        condition_ids = list(dict.fromkeys(
+            r.market_condition_id for r in pending
+            if r.market_condition_id in self._active_markets
+            and not self._active_markets[r.market_condition_id].resolution
+        ))
+        results = await asyncio.gather(
+            *(self._refresh_market_resolution(cid) for cid in condition_ids),
+            return_exceptions=True,
+        )
+        for cid, res in zip(condition_ids, results):
+            if isinstance(res, Exception):
+                logger.warning(f"Resolution refresh failed for {cid}: {res}")
 
+        resolved = []
+        for r in pending:
             m = self._active_markets.get(r.market_condition_id)
             if not m or not m.resolved or not m.resolution:
                 continue
@@ -343,6 +377,8 @@ class PolymarketClient:
             r.pnl = (r.size_usd / r.entry_price - r.size_usd) if won else -r.size_usd
             resolved.append(r)
             logger.info(f"{'✅' if won else '❌'} {r.trade_id} | {r.outcome.upper()} | ${r.pnl:+.2f}")
+        if resolved:
+            self.trade_revision += 1
         return resolved
 
     # ── Stats ───────────────────────────────────────────────────
@@ -361,5 +397,10 @@ class PolymarketClient:
             "total_pnl": pnl,
         }
 
+    @property
+    def active_markets(self) -> Mapping[str, BinaryMarket]:
+        """Read-only live view of discovered markets, keyed by condition id."""
+        return self._markets_view
+
     def get_trade_records(self) -> list[TradeRecord]:
         return self._trade_records.copy()
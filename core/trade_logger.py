@@ -5,15 +5,34 @@
 ╚══════════════════════════════════════════════════════════════════╝
 """
 
+import asyncio
 import json
 import time
 import os
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from config.settings import LoggingConfig
 
+logger = logging.getLogger("trade_logger")
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+QUEUE_MAXSIZE = 1024   # records buffered before new ones are dropped
+BATCH_MAX = 64         # records flushed per writer pass
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON — orjson when installed, stdlib json otherwise."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode()
+
 
 class TradeLogger:
     """
@@ -24,6 +43,11 @@ class TradeLogger:
       - strategy.jsonl: Every strategy decision (even HOLDs)
       - oracle.jsonl: Price feeds and consensus records
       - errors.log: Standard error log
+
+    Records are queued and written by a background task (started lazily
+    on first use inside an event loop), so callers never block on disk.
+    Files are append-only through descriptors held open for the process;
+    call close() at shutdown to flush and fsync.
     """
 
     def __init__(self, config: LoggingConfig):
@@ -46,12 +70,86 @@ class TradeLogger:
             ],
         )
 
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._closed = False
+        self._fds: dict[str, int] = {}  # persistent O_APPEND descriptors
+
+    # ── Background writer ───────────────────────────────────────
+
+    def _enqueue(self, filepath: str, data: dict):
+        """Hand a record to the writer task; writes inline when no loop is running."""
+        if self._writer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is None or self._closed:
+                self._flush([(filepath, data)])
+                return
+            self._queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+            self._writer = loop.create_task(self._drain())
+        try:
+            self._queue.put_nowait((filepath, data))
+        except asyncio.QueueFull:
+            logger.warning(f"Log queue full — dropped {data.get('_event', 'performance')} record")
+
+    async def _drain(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < BATCH_MAX and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._flush, batch)
+            except Exception as e:
+                logger.error(f"Log write failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _flush(self, batch: list):
+        """Write a batch with one append per file."""
+        lines: dict[str, list[bytes]] = {}
+        for filepath, data in batch:
+            lines.setdefault(filepath, []).append(_dumps(data) + b"\n")
+        for filepath, chunk in lines.items():
+            self._append(filepath, b"".join(chunk))
+
+    def _append(self, filepath: str, data: bytes):
+        """Append via a descriptor kept open until close()."""
+        if self._closed:
+            # close() already released the descriptors — don't own new ones
+            with open(filepath, "ab") as f:
+                f.write(data)
+            return
+        fd = self._fds.get(filepath)
+        if fd is None:
+            fd = os.open(filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._fds[filepath] = fd
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    async def close(self):
+        """Flush queued records, stop the writer task and fsync every log file."""
+        self._closed = True
+        if self._writer is not None:
+            await self._queue.join()
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        for fd in self._fds.values():
+            os.fsync(fd)
+            os.close(fd)
+        self._fds.clear()
+
+    # ── Log streams ─────────────────────────────────────────────
+
     def _write_jsonl(self, filepath: str, data: dict):
         """Append a JSON line to the specified file."""
         data["_ts"] = time.time()
         data["_iso"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        with open(filepath, "a") as f:
-            f.write(json.dumps(data, default=str) + "\n")
+        self._enqueue(filepath, data)
 
     def log_trade(self, trade_data: dict):
         """Log a trade event."""
@@ -79,10 +177,9 @@ class TradeLogger:
         self._write_jsonl(self.config.trade_log_file, risk_data)
 
     def save_performance(self, perf_data: dict):
-        """Save current performance snapshot."""
+        """Append a performance snapshot (NDJSON — the last line is current)."""
         perf_data["_saved_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        with open(self.config.performance_file, "w") as f:
-            json.dump(perf_data, f, indent=2, default=str)
+        self._enqueue(self.config.performance_file, perf_data)
 
     def get_trade_history(self) -> list[dict]:
         """Read all trade records from JSONL."""
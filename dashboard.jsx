@@ -1,6 +1,8 @@
 import { useState, useEffect, useRef, useCallback } from "react";
 
 // ── WebSocket Hook ────────────────────────────────────────────
+const decoder = new TextDecoder();
+
 function useBot(url = "ws://localhost:8765") {
   const [state, setState] = useState(null);
   const [connected, setConnected] = useState(false);
@@ -10,11 +12,17 @@ function useBot(url = "ws://localhost:8765") {
   const connect = useCallback(() => {
     try {
       const ws = new WebSocket(url);
+      ws.binaryType = "arraybuffer";  // state frames are UTF-8 JSON bytes
       wsRef.current = ws;
 
       ws.onopen = () => { setConnected(true); console.log("Dashboard connected"); };
       ws.onmessage = (e) => {
-        try { setState(JSON.parse(e.data)); } catch {}
+        try {
+          const msg = JSON.parse(typeof e.data === "string" ? e.data : decoder.decode(e.data));
+          // Patches carry only changed sections — merge onto the last full state
+          if (msg.type === "patch") setState((prev) => prev && { ...prev, ...msg.data, timestamp: msg.timestamp });
+          else setState(msg);
+        } catch {}
       };
       ws.onclose = () => {
         setConnected(false);
@@ -243,7 +251,7 @@ export default function Dashboard() {
                 <SigRow key={name}
                   label={name.replace(/_/g, " ").replace(/\b\w/g, c => c.toUpperCase())}
                   direction={s.direction} strength={s.strength}
-                  extra={name === "rsi" ? `RSI: ${s.raw_value}` : name === "price_vs_open" ? `Drift: ${s.raw_value > 0 ? "+" : ""}${s.raw_value}%` : null}
+                  extra={name === "rsi" ? `RSI: ${s.raw_value.toFixed(1)}` : name === "price_vs_open" ? `Drift: ${s.raw_value > 0 ? "+" : ""}${s.raw_value.toFixed(4)}%` : null}
                 />
               ))}
               {(!d.signals || Object.keys(d.signals).length === 0) && <div style={{ padding: 16, textAlign: "center", color: "#94a3b8", fontSize: 11 }}>Waiting for first cycle...</div>}
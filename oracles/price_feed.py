@@ -4,7 +4,7 @@
 ║                                                                    ║
 ║  Polymarket 15-min markets resolve against Chainlink BTC/USD.    ║
 ║  This engine:                                                      ║
-║    1. Fetches Chainlink price via Polymarket RTDS websocket       ║
+║    1. Streams Chainlink price via Polymarket RTDS websocket       ║
 ║    2. Falls back to Binance + CoinGecko for redundancy            ║
 ║    3. Tracks the OPENING PRICE of each 15-min window              ║
 ║    4. Provides candles from Binance for technical analysis         ║
@@ -25,7 +25,7 @@ import aiohttp
 logger = logging.getLogger("oracle")
 
 
-@dataclass
+@dataclass(slots=True)
 class PricePoint:
     source: str
     price: float
@@ -42,7 +42,7 @@ class PricePoint:
         return self.age_seconds > max_age
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsensusPrice:
     price: float
     timestamp: float
@@ -57,7 +57,7 @@ class ConsensusPrice:
         return f"${self.price:,.2f} | spread={self.spread_pct:.3f}% | [{src}]{cl}"
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowAnchor:
     """Tracks the opening price of the current 15-min window."""
     boundary_time: float         # Unix ts of boundary start (e.g. 12:00:00)
@@ -76,7 +76,7 @@ class WindowAnchor:
         return ((current - self.open_price) / self.open_price) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     timestamp: float
     open: float
@@ -102,64 +102,171 @@ class OracleEngine:
 
     MAX_DIVERGENCE_PCT = 1.0
     RTDS_URL = "wss://ws-live-data.polymarket.com"
-
-    def __init__(self, config):
+    RTDS_SUBSCRIBE = {
+        "action": "subscribe",
+        "subscriptions": [{
+            "topic": "crypto_prices_chainlink",
+            "type": "*",
+            "filters": '{"symbol":"btc/usd"}',
+        }]
+    }
+
+    def __init__(self, config, connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config.oracle
+        self._connector = connector  # shared pool, owned by the caller
         self._session: Optional[aiohttp.ClientSession] = None
         self._last_prices: dict[str, PricePoint] = {}
         self._price_history: list[ConsensusPrice] = []
         self._chainlink_price: Optional[float] = None
         self._chainlink_ts: float = 0
         self._window_anchor: Optional[WindowAnchor] = None
+        self._candles: dict[str, list[Candle]] = {}
+        self._stream_prices: dict[str, PricePoint] = {}
+        self._stream_tasks: list[asyncio.Task] = []
+        self._stream_window: float = 0
+
+    def use_connector(self, connector: aiohttp.BaseConnector):
+        """Share a caller-owned pool — used by sessions opened after this call."""
+        self._connector = connector
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=self._connector, connector_owner=self._connector is None,
+            )
         return self._session
 
     async def close(self):
+        for task in self._stream_tasks:
+            task.cancel()
+        await asyncio.gather(*self._stream_tasks, return_exceptions=True)
+        self._stream_tasks = []
         if self._session and not self._session.closed:
             await self._session.close()
 
+    # ── Streaming ────────────────────────────────────────────────
+
+    def _ensure_streams(self):
+        """Start the background price streams on first use (needs a running loop)."""
+        if self._stream_tasks:
+            return
+        self._stream_tasks = [
+            asyncio.create_task(self._run_stream("chainlink", self.RTDS_URL, self.RTDS_SUBSCRIBE, self._parse_rtds)),
+            asyncio.create_task(self._run_stream("binance", self.config.binance_ws_url, None, self._parse_binance_kline)),
+        ]
+
+    async def _run_stream(self, source: str, url: str, subscribe: Optional[dict], parse):
+        """Hold a websocket open and keep the latest price for `source` in memory."""
+        backoff = 1
+        while True:
+            try:
+                session = await self._get_session()
+                async with session.ws_connect(url, heartbeat=10) as ws:
+                    if subscribe:
+                        await ws.send_json(subscribe)
+                    backoff = 1
+                    async for msg in ws:
+                        if msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSE):
+                            break
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        # A malformed frame is skipped — only transport
+                        # failures are worth a reconnect
+                        try:
+                            pp = parse(json.loads(msg.data))
+                        except (ValueError, KeyError, TypeError) as e:
+                            logger.debug(f"{source} stream: skipped bad frame ({e})")
+                            continue
+                        if pp:
+                            self._stream_prices[source] = pp
+                            if source == "chainlink":
+                                self._track_window_open(pp)
+                logger.warning(f"{source} stream closed — reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"{source} stream failed: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    def _streamed(self, source: str) -> Optional[PricePoint]:
+        """Latest streamed price for `source`, or None if missing/stale."""
+        pp = self._stream_prices.get(source)
+        if pp and not pp.is_stale(self.config.stream_max_age):
+            return pp
+        return None
+
+    def _track_window_open(self, pp: PricePoint):
+        """
+        Anchor a window on the first Chainlink tick seen after its boundary.
+        Only applies once the stream has observed a boundary crossing — a
+        stream that starts mid-window leaves that window to capture_window_open.
+        """
+        boundary = float(int(pp.timestamp) // 900 * 900)
+        crossed = self._stream_window and boundary > self._stream_window
+        self._stream_window = boundary
+        if not crossed:
+            return
+        if self._window_anchor and self._window_anchor.boundary_time >= boundary:
+            return
+        self._window_anchor = WindowAnchor(
+            boundary_time=boundary, open_price=pp.price,
+            source="chainlink", captured_at=time.time(),
+        )
+        logger.info(
+            f"📌 Window anchor: ${pp.price:,.2f} (chainlink stream) "
+            f"for {time.strftime('%H:%M', time.localtime(boundary))} window"
+        )
+
+    def _parse_rtds(self, data) -> Optional[PricePoint]:
+        if not isinstance(data, dict) or data.get("topic") != "crypto_prices_chainlink":
+            return None
+        payload = data.get("payload")
+        if not isinstance(payload, dict) or payload.get("symbol") != "btc/usd" or "value" not in payload:
+            return None
+        price = float(payload["value"])
+        ts = payload.get("timestamp", time.time() * 1000) / 1000
+        self._chainlink_price = price
+        self._chainlink_ts = ts
+        return PricePoint(source="chainlink", price=price, timestamp=ts)
+
+    @staticmethod
+    def _parse_binance_kline(data) -> Optional[PricePoint]:
+        if not isinstance(data, dict):
+            return None
+        k = data.get("k")
+        close = k.get("c") if isinstance(k, dict) else None
+        if close is None:
+            return None
+        return PricePoint(source="binance", price=float(close), timestamp=data.get("E", time.time() * 1000) / 1000)
+
     # ── Chainlink via Polymarket RTDS ────────────────────────────
 
     async def _fetch_chainlink_rtds(self) -> Optional[PricePoint]:
         """
-        Connect to Polymarket RTDS websocket, subscribe to
-        crypto_prices_chainlink, grab one BTC/USD price, disconnect.
+        Latest streamed Chainlink price; if the stream is stale, connect to
+        Polymarket RTDS, subscribe to crypto_prices_chainlink, grab one
+        BTC/USD price, disconnect.
         """
+        streamed = self._streamed("chainlink")
+        if streamed:
+            return streamed
         try:
             session = await self._get_session()
             async with session.ws_connect(self.RTDS_URL, timeout=8) as ws:
                 # Subscribe to Chainlink BTC/USD
-                await ws.send_json({
-                    "action": "subscribe",
-                    "subscriptions": [{
-                        "topic": "crypto_prices_chainlink",
-                        "type": "*",
-                        "filters": '{"symbol":"btc/usd"}',
-                    }]
-                })
+                await ws.send_json(self.RTDS_SUBSCRIBE)
 
                 # Wait for one price update (timeout 6s)
                 start = time.time()
                 while time.time() - start < 6:
                     msg = await asyncio.wait_for(ws.receive(), timeout=6)
                     if msg.type == aiohttp.WSMsgType.TEXT:
-                        data = json.loads(msg.data)
-                        if data.get("topic") == "crypto_prices_chainlink":
-                            payload = data.get("payload", {})
-                            if payload.get("symbol") == "btc/usd" and "value" in payload:
-                                price = float(payload["value"])
-                                ts = payload.get("timestamp", time.time() * 1000) / 1000
-                                self._chainlink_price = price
-                                self._chainlink_ts = ts
-                                logger.info(f"Chainlink BTC/USD: ${price:,.2f}")
-                                return PricePoint(
-                                    source="chainlink",
-                                    price=price,
-                                    timestamp=ts,
-                                )
+                        pp = self._parse_rtds(json.loads(msg.data))
+                        if pp:
+                            logger.info(f"Chainlink BTC/USD: ${pp.price:,.2f}")
+                            return pp
                     elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                         break
 
@@ -172,6 +279,9 @@ class OracleEngine:
     # ── Binance ──────────────────────────────────────────────────
 
     async def _fetch_binance(self) -> Optional[PricePoint]:
+        streamed = self._streamed("binance")
+        if streamed:
+            return streamed
         try:
             session = await self._get_session()
             url = f"{self.config.binance_base_url}/ticker/bookTicker"
@@ -208,13 +318,17 @@ class OracleEngine:
         """
         Fetch BTC price. Chainlink is primary (resolution oracle).
         Binance + CoinGecko provide redundancy and divergence checks.
+
+        Chainlink and Binance are read from the background streams when
+        fresh; CoinGecko is only polled when the streams alone can't
+        reach consensus. With healthy streams this is a memory read.
         """
-        results = await asyncio.gather(
-            self._fetch_chainlink_rtds(),
-            self._fetch_binance(),
-            self._fetch_coingecko(),
-            return_exceptions=True,
-        )
+        self._ensure_streams()
+        fetches = [self._fetch_chainlink_rtds(), self._fetch_binance()]
+        streamed = sum(1 for src in ("chainlink", "binance") if self._streamed(src))
+        if streamed < self.config.min_oracle_consensus:
+            fetches.append(self._fetch_coingecko())
+        results = await asyncio.gather(*fetches, return_exceptions=True)
 
         valid: list[PricePoint] = []
         chainlink_pp = None
@@ -266,11 +380,7 @@ class OracleEngine:
 
     def _current_window_boundary(self) -> float:
         """Start of the CURRENT 15-min window (the one we're inside)."""
-        now = time.time()
-        dt = datetime.datetime.fromtimestamp(now)
-        window_start_min = (dt.minute // 15) * 15
-        boundary = dt.replace(minute=window_start_min, second=0, microsecond=0)
-        return boundary.timestamp()
+        return float(int(time.time()) // 900 * 900)
 
     async def capture_window_open(self) -> WindowAnchor:
         """
@@ -313,16 +423,26 @@ class OracleEngine:
     # ── Candles ──────────────────────────────────────────────────
 
     async def get_candles(self, interval: str = "15m", limit: int = 100) -> list[Candle]:
-        """Fetch historical candles from Binance (best candle source)."""
+        """
+        Fetch historical candles from Binance (best candle source).
+
+        Candles are cached per interval; once the cache holds `limit` bars
+        only the still-forming bar onward is fetched and merged in.
+        """
         try:
             session = await self._get_session()
             url = f"{self.config.binance_base_url}/klines"
-            params = {"symbol": "BTCUSDT", "interval": interval, "limit": min(limit, 1000)}
+            cached = self._candles.get(interval, [])
+            req_limit = min(limit, 1000)
+            params = {"symbol": "BTCUSDT", "interval": interval, "limit": req_limit}
+            warm = len(cached) >= limit
+            if warm:
+                params["startTime"] = int(cached[-1].timestamp * 1000)
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     raise RuntimeError(f"Binance klines {resp.status}")
                 data = await resp.json()
-            return [
+            fetched = [
                 Candle(
                     timestamp=k[0] / 1000, open=float(k[1]),
                     high=float(k[2]), low=float(k[3]),
@@ -331,6 +451,23 @@ class OracleEngine:
                 )
                 for k in data
             ]
+            if warm and len(fetched) >= req_limit:
+                # Gap too large to patch — drop the cache and refetch in full
+                self._candles.pop(interval, None)
+                return await self.get_candles(interval, limit)
+            if warm and fetched:
+                # Replace the bars we re-fetched (the last one was still forming)
+                first_ts = fetched[0].timestamp
+                keep = len(cached)
+                while keep and cached[keep - 1].timestamp >= first_ts:
+                    keep -= 1
+                merged = cached[:keep] + fetched
+            elif warm:
+                merged = cached
+            else:
+                merged = fetched
+            self._candles[interval] = merged[-max(limit, self.config.history_candle_count):]
+            return merged[-limit:]
         except Exception as e:
             logger.error(f"Candles: {e}")
             return []
@@ -27,7 +27,7 @@ from oracles.price_feed import Candle
 logger = logging.getLogger("strategy")
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     name: str
     direction: MarketDirection
@@ -36,7 +36,7 @@ class Signal:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyDecision:
     direction: MarketDirection
     confidence: float
@@ -117,10 +117,10 @@ class StrategyEngine:
         signal_line = StrategyEngine._ema(macd_line, signal)
         return macd_line[-1], signal_line[-1], macd_line[-1] - signal_line[-1]
 
-    def _volatility(self, candles: list[Candle]) -> float:
-        if len(candles) < 2:
+    def _volatility(self, closes: list[float]) -> float:
+        if len(closes) < 2:
             return 0.0
-        returns = [((candles[i].close - candles[i-1].close) / candles[i-1].close) * 100 for i in range(1, len(candles))]
+        returns = [((closes[i] - closes[i-1]) / closes[i-1]) * 100 for i in range(1, len(closes))]
         mean = sum(returns) / len(returns)
         return math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
 
@@ -153,12 +153,12 @@ class StrategyEngine:
             f"Price vs window open: {drift_pct:+.4f}%"
         )
 
-    def _signal_momentum(self, candles: list[Candle]) -> Signal:
-        lookback = min(self.config.momentum_lookback, len(candles) - 1)
+    def _signal_momentum(self, closes: list[float]) -> Signal:
+        lookback = min(self.config.momentum_lookback, len(closes) - 1)
         if lookback < 1:
             return Signal("momentum", MarketDirection.HOLD, 0.0, 0.0, "No data")
-        current = candles[-1].close
-        past = candles[-(lookback + 1)].close
+        current = closes[-1]
+        past = closes[-(lookback + 1)]
         pct = ((current - past) / past) * 100
         strength = min(1.0, abs(pct) / 0.5)
         if pct > 0.02:
@@ -170,8 +170,7 @@ class StrategyEngine:
             strength = 0.0
         return Signal("momentum", d, strength, pct, f"{lookback}-candle: {pct:+.3f}%")
 
-    def _signal_rsi(self, candles: list[Candle]) -> Signal:
-        closes = [c.close for c in candles]
+    def _signal_rsi(self, closes: list[float]) -> Signal:
         rsi = self._rsi(closes, self.config.rsi_period)
         if rsi > self.config.rsi_overbought:
             d, strength = MarketDirection.DOWN, min(1.0, (rsi - self.config.rsi_overbought) / 15)
@@ -187,8 +186,7 @@ class StrategyEngine:
                 strength = (center - rsi) / (center - self.config.rsi_oversold) * 0.3
         return Signal("rsi", d, strength, rsi, f"RSI={rsi:.1f}")
 
-    def _signal_macd(self, candles: list[Candle]) -> Signal:
-        closes = [c.close for c in candles]
+    def _signal_macd(self, closes: list[float]) -> Signal:
         macd_line, signal_line, histogram = self._macd(
             closes, self.config.macd_fast, self.config.macd_slow, self.config.macd_signal
         )
@@ -201,8 +199,7 @@ class StrategyEngine:
                 strength = min(1.0, strength * 1.5)
         return Signal("macd", d, strength, histogram, f"MACD hist={histogram:.2f}")
 
-    def _signal_ema_cross(self, candles: list[Candle]) -> Signal:
-        closes = [c.close for c in candles]
+    def _signal_ema_cross(self, closes: list[float]) -> Signal:
         ema_fast = self._ema(closes, self.config.ema_fast)
         ema_slow = self._ema(closes, self.config.ema_slow)
         if not ema_fast or not ema_slow:
@@ -238,7 +235,10 @@ class StrategyEngine:
                 None, 0.0, False, "Insufficient data (<30 candles)", 0.0,
             )
 
-        volatility = self._volatility(candles[-20:])
+        # Every indicator works on closes — extract the column once
+        closes = [c.close for c in candles]
+
+        volatility = self._volatility(closes[-20:])
         if volatility < self.config.min_volatility_pct:
             return StrategyDecision(
                 MarketDirection.HOLD, 0.0, [], current_price, open_price,
@@ -274,10 +274,10 @@ class StrategyEngine:
             weights["ema_cross"] = self.config.weight_ema_cross
 
         signals.extend([
-            self._signal_momentum(candles),
-            self._signal_rsi(candles),
-            self._signal_macd(candles),
-            self._signal_ema_cross(candles),
+            self._signal_momentum(closes),
+            self._signal_rsi(closes),
+            self._signal_macd(closes),
+            self._signal_ema_cross(closes),
         ])
 
         # ── Weighted score ──